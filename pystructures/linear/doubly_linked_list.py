@@ -1,62 +1,227 @@
 from typing import Any, Optional, Iterator, Iterable, TypeVar, Type
+from operator import countOf, indexOf
 from copy import deepcopy
 
 T = TypeVar("T", bound="DoublyLinkedList")
 
+_MARK_STRIDE = 64
+_MAX_FREE = 1024
+
 class DoublyLinkedList:
     """
     DoublyLinkedList implements a classic doubly linked list with a full Pythonic API.
     - Supports O(1) append, prepend, pop operations; O(n) insert, remove, find, and index-based access.
     - Iterator protocol (__iter__, __reversed__), rich comparison (__eq__), and list-like methods.
     - Data type: Any.
-    """
 
-    class _Node:
-        __slots__ = ('data', 'prev', 'next')
+    Nodes are stored as slots in parallel lists: `_data[i]` holds the value,
+    `_prev[i]`/`_next[i]` the neighbouring slots (-1 terminates the chain).
+    Released slots are chained into a free-list and reused by later inserts;
+    once more than _MAX_FREE slots sit unused (and they outnumber the live
+    ones) the storage is compacted.
+    `_marks[j]` caches the slot at position j * _MARK_STRIDE so index-based
+    access walks at most _MARK_STRIDE links once the marks are built, and
+    `_cursor_pos`/`_cursor_slot` remember the last node located so that
+    sequential access walks only the gap from it.
+    While `_ordered` is set the storage has no free slots and slot i holds
+    position i (true after construction and any run of appends), so
+    scans and index lookups go straight to `_data`.
+    """
 
-        def __init__(self, data: Any, prev: Optional['DoublyLinkedList._Node'] = None, next: Optional['DoublyLinkedList._Node'] = None):
-            self.data = data
-            self.prev = prev
-            self.next = next
+    __slots__ = ('_data', '_prev', '_next', '_head', '_tail', '_free', '_free_count', '_size', '_marks',
+                 '_cursor_pos', '_cursor_slot', '_ordered', '__weakref__')
 
     def __init__(self, iterable: Optional[Iterable[Any]] = None) -> None:
         """
         Initialize an empty list or fill from iterable.
         """
-        self._head: Optional[DoublyLinkedList._Node] = None
-        self._tail: Optional[DoublyLinkedList._Node] = None
+        self._data: list[Any] = []
+        self._prev: list[int] = []
+        self._next: list[int] = []
+        self._head: int = -1
+        self._tail: int = -1
+        self._free: int = -1
+        self._free_count: int = 0
         self._size: int = 0
+        self._marks: list[int] = []
+        self._cursor_pos: int = -1
+        self._cursor_slot: int = -1
+        self._ordered: bool = True
         if iterable is not None:
-            for item in iterable:
-                self.append(item)
+            self.extend(iterable)
+
+    def _alloc(self, data: Any, prev: int = -1, next: int = -1) -> int:
+        """
+        Internal: Take a slot from the free-list (or grow the lists) and fill it.
+        """
+        values = self._data
+        slot = self._free
+        if slot != -1:
+            links = self._next
+            self._free = links[slot]
+            self._free_count -= 1
+            values[slot] = data
+            self._prev[slot] = prev
+            links[slot] = next
+        else:
+            slot = len(values)
+            values.append(data)
+            self._prev.append(prev)
+            self._next.append(next)
+        return slot
+
+    def _compact(self) -> None:
+        """
+        Internal: Rebuild storage in list order, dropping all free slots.
+        """
+        items = list(self)
+        self.clear()
+        self.extend(items)
+
+    def _unlink(self, slot: int) -> Any:
+        """
+        Internal: Detach slot from the chain and return its value.
+        The slot goes back to the free-list, with the free link written to
+        both link lists so reverse() can swap them; the last slot of ordered
+        storage is dropped instead, keeping it ordered.
+        """
+        prv = self._prev
+        links = self._next
+        prev = prv[slot]
+        nxt = links[slot]
+        if prev != -1:
+            links[prev] = nxt
+        else:
+            self._head = nxt
+        if nxt != -1:
+            prv[nxt] = prev
+        else:
+            self._tail = prev
+        size = self._size = self._size - 1
+        values = self._data
+        data = values[slot]
+        if self._ordered:
+            if slot == len(values) - 1:
+                values.pop()
+                prv.pop()
+                links.pop()
+                return data
+            self._ordered = False
+        values[slot] = None
+        prv[slot] = links[slot] = self._free
+        self._free = slot
+        free_count = self._free_count = self._free_count + 1
+        if not size:
+            self.clear()
+        elif free_count > _MAX_FREE and free_count > size:
+            self._compact()
+        return data
+
+    def _slot_at(self, index: int) -> int:
+        """
+        Internal: Return slot of the node at (non-negative, valid) index.
+        Walks from the cursor (in either direction) when it is closer than
+        both the nearest position mark and the tail, and leaves the cursor
+        at index.
+        """
+        if self._ordered:
+            return index
+        pos = self._cursor_pos
+        dist = index - pos
+        if pos != -1 and abs(dist) < min(index % _MARK_STRIDE, self._size - 1 - index):
+            slot = self._cursor_slot
+            if dist > 0:
+                nxt = self._next
+                for _ in range(dist):
+                    slot = nxt[slot]
+            else:
+                prv = self._prev
+                for _ in range(-dist):
+                    slot = prv[slot]
+        else:
+            slot = self._seek(index)
+        self._cursor_pos = index
+        self._cursor_slot = slot
+        return slot
+
+    def _seek(self, index: int) -> int:
+        """
+        Internal: Return slot of the node at (non-negative, valid) index.
+        Starts from the nearest position mark or from the tail, whichever is
+        closer, recording new marks while walking forward past the last one.
+        """
+        nxt = self._next
+        marks = self._marks
+        back = self._size - 1 - index
+        mark = index // _MARK_STRIDE
+        if mark < len(marks):
+            ahead = index - mark * _MARK_STRIDE
+            if ahead <= back:
+                slot = marks[mark]
+                for _ in range(ahead):
+                    slot = nxt[slot]
+                return slot
+        elif marks:
+            pos = (len(marks) - 1) * _MARK_STRIDE
+            ahead = index - pos
+        else:
+            pos = 0
+            ahead = index
+        if back < ahead:
+            prv = self._prev
+            slot = self._tail
+            for _ in range(back):
+                slot = prv[slot]
+            return slot
+        if marks:
+            slot = marks[-1]
+        else:
+            slot = self._head
+            marks.append(slot)
+        while pos + _MARK_STRIDE <= index:
+            for _ in range(_MARK_STRIDE):
+                slot = nxt[slot]
+            pos += _MARK_STRIDE
+            marks.append(slot)
+        for _ in range(index - pos):
+            slot = nxt[slot]
+        return slot
+
+    def _invalidate(self, index: int) -> None:
+        """
+        Internal: Drop position marks (and the cursor) at or after index
+        (positions shifted).
+        """
+        del self._marks[(index + _MARK_STRIDE - 1) // _MARK_STRIDE:]
+        if self._cursor_pos >= index:
+            self._cursor_pos = -1
 
     def append(self, data: Any) -> None:
         """
         Add data to the end of the list. O(1).
         """
-        node = self._Node(data)
-        if not self._tail:
-            self._head = node
-            self._tail = node
+        tail = self._tail
+        slot = self._alloc(data, tail)
+        if tail == -1:
+            self._head = slot
         else:
-            node.prev = self._tail
-            self._tail.next = node
-            self._tail = node
+            self._next[tail] = slot
+        self._tail = slot
         self._size += 1
 
     def prepend(self, data: Any) -> None:
         """
         Add data to the beginning of the list. O(1).
         """
-        node = self._Node(data)
-        if not self._head:
-            self._head = node
-            self._tail = node
+        slot = self._alloc(data, -1, self._head)
+        if self._head == -1:
+            self._tail = slot
         else:
-            node.next = self._head
-            self._head.prev = node
-            self._head = node
+            self._prev[self._head] = slot
+            self._ordered = False
+        self._head = slot
         self._size += 1
+        self._invalidate(0)
 
     def insert(self, index: int, data: Any) -> None:
         """
@@ -73,16 +238,16 @@ class DoublyLinkedList:
         if index == self._size:
             self.append(data)
             return
-        curr = self._head
-        for _ in range(index):
-            curr = curr.next  # type: ignore
-        node = self._Node(data, prev=curr.prev, next=curr)
-        if curr.prev:
-            curr.prev.next = node
-        curr.prev = node
-        if index == 0:
-            self._head = node
+        curr = self._slot_at(index)
+        prev = self._prev[curr]
+        slot = self._alloc(data, prev, curr)
+        self._next[prev] = slot
+        self._prev[curr] = slot
         self._size += 1
+        self._ordered = False
+        self._invalidate(index)
+        self._cursor_pos = index
+        self._cursor_slot = slot
 
     def pop(self, index: int = -1) -> Any:
         """
@@ -96,55 +261,43 @@ class DoublyLinkedList:
         if index < 0 or index >= self._size:
             raise IndexError("Index out of range")
         if index == 0:
-            node = self._head
-            assert node is not None
-            self._head = node.next
-            if self._head:
-                self._head.prev = None
-            if self._size == 1:
-                self._tail = None
-            self._size -= 1
-            return node.data
-        if index == self._size - 1:
-            node = self._tail
-            assert node is not None
-            self._tail = node.prev
-            if self._tail:
-                self._tail.next = None
-            if self._size == 1:
-                self._head = None
-            self._size -= 1
-            return node.data
-        curr = self._head
-        for _ in range(index):
-            curr = curr.next  # type: ignore
-        assert curr is not None
-        if curr.prev:
-            curr.prev.next = curr.next
-        if curr.next:
-            curr.next.prev = curr.prev
-        self._size -= 1
-        return curr.data
+            slot = self._head
+        elif index == self._size - 1:
+            slot = self._tail
+        else:
+            slot = self._slot_at(index)
+        del self._marks[(index + _MARK_STRIDE - 1) // _MARK_STRIDE:]
+        if slot != self._tail:
+            self._cursor_pos = index
+            self._cursor_slot = self._next[slot]
+        elif self._cursor_pos >= index:
+            self._cursor_pos = -1
+        return self._unlink(slot)
 
     def remove(self, value: Any) -> None:
         """
         Remove first occurrence of value. O(n).
         Raises ValueError if not found.
         """
-        curr = self._head
-        while curr:
-            if curr.data == value:
-                if curr.prev:
-                    curr.prev.next = curr.next
-                else:
-                    self._head = curr.next
-                if curr.next:
-                    curr.next.prev = curr.prev
-                else:
-                    self._tail = curr.prev
-                self._size -= 1
+        if self._ordered:
+            try:
+                index = self._data.index(value)
+            except ValueError:
+                raise ValueError(f"{value} not found in list") from None
+            self.pop(index)
+            return
+        data = self._data
+        nxt = self._next
+        slot = self._head
+        idx = 0
+        while slot != -1:
+            item = data[slot]
+            if item is value or item == value:
+                self._invalidate(idx)
+                self._unlink(slot)
                 return
-            curr = curr.next
+            slot = nxt[slot]
+            idx += 1
         raise ValueError(f"{value} not found in list")
 
     def get(self, index: int) -> Any:
@@ -156,31 +309,33 @@ class DoublyLinkedList:
             index += self._size
         if index < 0 or index >= self._size:
             raise IndexError("Index out of range")
-        curr = self._head
-        for _ in range(index):
-            curr = curr.next  # type: ignore
-        return curr.data  # type: ignore
+        return self._data[self._slot_at(index)]
 
     def find(self, value: Any) -> int:
         """
         Return index of first occurrence of value, or -1 if not found. O(n).
         """
-        curr = self._head
-        idx = 0
-        while curr:
-            if curr.data == value:
-                return idx
-            curr = curr.next
-            idx += 1
-        return -1
+        try:
+            return self._data.index(value) if self._ordered else indexOf(self, value)
+        except ValueError:
+            return -1
 
     def clear(self) -> None:
         """
         Remove all elements. O(1).
         """
-        self._head = None
-        self._tail = None
+        self._data = []
+        self._prev = []
+        self._next = []
+        self._head = -1
+        self._tail = -1
+        self._free = -1
+        self._free_count = 0
         self._size = 0
+        self._marks = []
+        self._cursor_pos = -1
+        self._cursor_slot = -1
+        self._ordered = True
 
     def copy(self) -> T:
         """
@@ -198,45 +353,50 @@ class DoublyLinkedList:
         """
         Support for copy.deepcopy(). O(n).
         """
-        copied = DoublyLinkedList()
-        curr = self._head
-        while curr:
-            copied.append(deepcopy(curr.data, memo))
-            curr = curr.next
-        return copied
+        return DoublyLinkedList(deepcopy(self.to_list(), memo))
 
     def reverse(self) -> None:
         """
-        Reverse the list in place. O(n).
+        Reverse the list in place. O(1).
+        Swapping the link lists turns every `next` into `prev` and back.
         """
-        curr = self._head
-        self._tail = self._head
-        prev = None
-        while curr:
-            nxt = curr.next
-            curr.next = prev
-            curr.prev = nxt
-            prev = curr
-            curr = nxt
-        self._head = prev
+        self._prev, self._next = self._next, self._prev
+        self._head, self._tail = self._tail, self._head
+        self._invalidate(0)
+        if self._size > 1:
+            self._ordered = False
 
     def extend(self, iterable: Iterable[Any]) -> None:
         """
         Append all elements from iterable. O(n).
+        Links the new slots in one pass instead of appending one by one.
         """
-        for item in iterable:
-            self.append(item)
+        items = list(iterable)
+        n = len(items)
+        if not n:
+            return
+        start = len(self._data)
+        self._data.extend(items)
+        nxt = self._next
+        nxt.extend(range(start + 1, start + n + 1))
+        nxt[-1] = -1
+        prv = self._prev
+        prv.extend(range(start - 1, start + n - 1))
+        prv[start] = self._tail
+        if self._tail == -1:
+            self._head = start
+        else:
+            nxt[self._tail] = start
+        self._tail = start + n - 1
+        self._size += n
 
     def to_list(self) -> list[Any]:
         """
         Convert to Python list. O(n).
         """
-        result = []
-        curr = self._head
-        while curr:
-            result.append(curr.data)
-            curr = curr.next
-        return result
+        if self._ordered:
+            return self._data[:]
+        return list(self)
 
     @classmethod
     def from_iterable(cls: Type[T], iterable: Iterable[Any]) -> T:
@@ -255,25 +415,45 @@ class DoublyLinkedList:
         """
         Iterator over elements (forward). O(n).
         """
-        curr = self._head
-        while curr:
-            yield curr.data
-            curr = curr.next
+        if self._ordered:
+            return iter(self._data)
+        return self._walk()
+
+    def _walk(self) -> Iterator[Any]:
+        """
+        Internal: Generator following the links from the head.
+        """
+        data = self._data
+        nxt = self._next
+        slot = self._head
+        while slot != -1:
+            yield data[slot]
+            slot = nxt[slot]
 
     def __reversed__(self) -> Iterator[Any]:
         """
         Iterator over elements (backward). O(n).
         """
-        curr = self._tail
-        while curr:
-            yield curr.data
-            curr = curr.prev
+        if self._ordered:
+            return reversed(self._data)
+        return self._walk_back()
+
+    def _walk_back(self) -> Iterator[Any]:
+        """
+        Internal: Generator following the links from the tail.
+        """
+        data = self._data
+        prv = self._prev
+        slot = self._tail
+        while slot != -1:
+            yield data[slot]
+            slot = prv[slot]
 
     def __str__(self) -> str:
         """
         String representation. O(n).
         """
-        return f"DoublyLinkedList([{', '.join(repr(x) for x in self)}])"
+        return f"DoublyLinkedList([{', '.join(map(repr, self))}])"
 
     def __repr__(self) -> str:
         return str(self)
@@ -293,45 +473,40 @@ class DoublyLinkedList:
             index += self._size
         if index < 0 or index >= self._size:
             raise IndexError("Index out of range")
-        curr = self._head
-        for _ in range(index):
-            curr = curr.next  # type: ignore
-        curr.data = value  # type: ignore
+        self._data[self._slot_at(index)] = value
 
     def __eq__(self, other: object) -> bool:
         """
         Compare lists element-wise. O(n).
         """
+        if self is other:
+            return True
         if not isinstance(other, DoublyLinkedList):
             return False
         if self._size != other._size:
             return False
-        a = self._head
-        b = other._head
-        while a and b:
-            if a.data != b.data:
+        if self._ordered and other._ordered:
+            return self._data == other._data
+        for a, b in zip(self, other):
+            if a is not b and a != b:
                 return False
-            a = a.next
-            b = b.next
         return True
 
     def contains(self, value: Any) -> bool:
         """
         Return True if value exists. O(n).
         """
-        return self.find(value) != -1
+        if self._ordered:
+            return value in self._data
+        return value in iter(self)
 
     def count(self, value: Any) -> int:
         """
         Count occurrences of value. O(n).
         """
-        cnt = 0
-        curr = self._head
-        while curr:
-            if curr.data == value:
-                cnt += 1
-            curr = curr.next
-        return cnt
+        if self._ordered:
+            return self._data.count(value)
+        return countOf(self, value)
 
     def is_empty(self) -> bool:
         """
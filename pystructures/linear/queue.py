@@ -1,4 +1,5 @@
 from typing import Any, Optional, Iterable, TypeVar, Type
+from collections import deque
 from copy import deepcopy
 
 T = TypeVar("T", bound="Queue")
@@ -10,101 +11,82 @@ class Queue:
     - No iterator or index-based access.
     - Comparison, copy, bulk operations, and utility methods.
     - Stores any Python object.
+
+    Elements are kept in a collections.deque (front at the left end).
     """
 
-    class _Node:
-        __slots__ = ('data', 'next')
-        def __init__(self, data: Any, next: Optional['Queue._Node'] = None):
-            self.data = data
-            self.next = next
+    __slots__ = ('_data', '__weakref__')
 
     def __init__(self, iterable: Optional[Iterable[Any]] = None) -> None:
         """
         Initialize an empty queue or fill from iterable (left to right).
         The first element of iterable becomes the front of the queue.
         """
-        self._front: Optional[Queue._Node] = None
-        self._rear: Optional[Queue._Node] = None
-        self._size: int = 0
-        if iterable is not None:
-            for item in iterable:
-                self.enqueue(item)
+        self._data: deque = deque() if iterable is None else deque(iterable)
 
     def enqueue(self, data: Any) -> None:
         """
         Add data to the rear of the queue. O(1).
         """
-        node = self._Node(data)
-        if not self._front:
-            self._front = self._rear = node
-        else:
-            assert self._rear is not None
-            self._rear.next = node
-            self._rear = node
-        self._size += 1
+        self._data.append(data)
 
     def dequeue(self) -> Any:
         """
         Remove and return the front element. Raises IndexError if empty. O(1).
         """
-        if self._front is None:
-            raise IndexError("Dequeue from empty queue")
-        node = self._front
-        self._front = node.next
-        if self._front is None:
-            self._rear = None
-        self._size -= 1
-        return node.data
+        try:
+            return self._data.popleft()
+        except IndexError:
+            raise IndexError("Dequeue from empty queue") from None
 
     def front(self) -> Any:
         """
         Return the front element without removing. Raises IndexError if empty. O(1).
         """
-        if self._front is None:
-            raise IndexError("Front from empty queue")
-        return self._front.data
+        try:
+            return self._data[0]
+        except IndexError:
+            raise IndexError("Front from empty queue") from None
 
     def rear(self) -> Any:
         """
         Return the rear element without removing. Raises IndexError if empty. O(1).
         """
-        if self._rear is None:
-            raise IndexError("Rear from empty queue")
-        return self._rear.data
+        try:
+            return self._data[-1]
+        except IndexError:
+            raise IndexError("Rear from empty queue") from None
 
     def is_empty(self) -> bool:
         """
         Return True if the queue is empty. O(1).
         """
-        return self._size == 0
+        return not self._data
 
     def clear(self) -> None:
         """
         Remove all elements from the queue. O(1).
         """
-        self._front = None
-        self._rear = None
-        self._size = 0
+        self._data.clear()
 
     def copy(self) -> T:
         """
         Return a shallow copy of the queue. O(n).
         """
-        return Queue(self.to_list())
+        return Queue(self._data)
 
     def __copy__(self) -> T:
         return self.copy()
 
     def __deepcopy__(self, memo) -> T:
-        items = [deepcopy(x, memo) for x in self.to_list()]
+        items = [deepcopy(x, memo) for x in self._data]
         return Queue(items)
 
     def extend(self, iterable: Iterable[Any]) -> None:
         """
         Enqueue all elements from iterable (left to right). O(n).
         """
-        for item in iterable:
-            self.enqueue(item)
+        self._data.extend(iterable)
 
     @classmethod
     def from_iterable(cls: Type[T], iterable: Iterable[Any]) -> T:
@@ -117,35 +99,19 @@ class Queue:
         """
         Convert queue to Python list (front to rear). O(n).
         """
-        result = []
-        node = self._front
-        while node:
-            result.append(node.data)
-            node = node.next
-        return result
+        return list(self._data)
 
     def contains(self, value: Any) -> bool:
         """
         Return True if value exists in queue. O(n).
         """
-        node = self._front
-        while node:
-            if node.data == value:
-                return True
-            node = node.next
-        return False
+        return value in self._data
 
     def count(self, value: Any) -> int:
         """
         Count occurrences of value. O(n).
         """
-        cnt = 0
-        node = self._front
-        while node:
-            if node.data == value:
-                cnt += 1
-            node = node.next
-        return cnt
+        return self._data.count(value)
 
     def __contains__(self, value: Any) -> bool:
         return self.contains(value)
@@ -154,13 +120,13 @@ class Queue:
         """
         Return the number of elements in the queue. O(1).
         """
-        return self._size
+        return len(self._data)
 
     def __str__(self) -> str:
         """
         String representation. O(n).
         """
-        return f"Queue([{', '.join(repr(x) for x in self.to_list())}])"
+        return f"Queue([{', '.join(map(repr, self._data))}])"
 
     def __repr__(self) -> str:
         return str(self)
@@ -169,6 +135,8 @@ class Queue:
         """
         Compare queues element-wise. O(n).
         """
+        if self is other:
+            return True
         if not isinstance(other, Queue):
             return False
-        return self.to_list() == other.to_list()
\ No newline at end of file
+        return self._data == other._data
\ No newline at end of file
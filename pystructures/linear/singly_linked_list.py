@@ -1,57 +1,187 @@
 from typing import Any, Optional, Iterator, Iterable, TypeVar, Type
+from operator import countOf, indexOf
 from copy import deepcopy
 
 T = TypeVar("T", bound="SinglyLinkedList")
 
+_MARK_STRIDE = 64
+_MAX_FREE = 1024
+
 class SinglyLinkedList:
     """
     SinglyLinkedList implements a classic singly linked list with full Pythonic API.
     - Supports O(1) append/prepend, O(n) insert, remove, pop, find, and index-based access.
     - Iterator protocol (__iter__), rich comparison (__eq__), and list-like methods.
     - Data type: Any.
-    """
 
-    class _Node:
-        __slots__ = ('data', 'next')
+    Nodes are stored as slots in parallel lists: `_data[i]` holds the value
+    and `_next[i]` the slot of the following node (-1 terminates the chain).
+    Released slots are chained into a free-list and reused by later inserts;
+    once more than _MAX_FREE slots sit unused (and they outnumber the live
+    ones) the storage is compacted.
+    `_marks[j]` caches the slot at position j * _MARK_STRIDE so index-based
+    access walks at most _MARK_STRIDE links once the marks are built, and
+    `_cursor_pos`/`_cursor_slot` remember the last node located so that
+    sequential access walks only the gap from it.
+    While `_ordered` is set the storage has no free slots and slot i holds
+    position i (true after construction and any run of appends), so
+    scans and index lookups go straight to `_data`.
+    """
 
-        def __init__(self, data: Any, next: Optional['SinglyLinkedList._Node'] = None):
-            self.data = data
-            self.next = next
+    __slots__ = ('_data', '_next', '_head', '_tail', '_free', '_free_count', '_size', '_marks',
+                 '_cursor_pos', '_cursor_slot', '_ordered', '__weakref__')
 
     def __init__(self, iterable: Optional[Iterable[Any]] = None) -> None:
         """
         Initialize an empty list or fill from iterable.
         """
-        self._head: Optional[SinglyLinkedList._Node] = None
-        self._tail: Optional[SinglyLinkedList._Node] = None
+        self._data: list[Any] = []
+        self._next: list[int] = []
+        self._head: int = -1
+        self._tail: int = -1
+        self._free: int = -1
+        self._free_count: int = 0
         self._size: int = 0
+        self._marks: list[int] = []
+        self._cursor_pos: int = -1
+        self._cursor_slot: int = -1
+        self._ordered: bool = True
         if iterable is not None:
-            for item in iterable:
-                self.append(item)
+            self.extend(iterable)
+
+    def _alloc(self, data: Any, next: int = -1) -> int:
+        """
+        Internal: Take a slot from the free-list (or grow the lists) and fill it.
+        """
+        values = self._data
+        slot = self._free
+        if slot != -1:
+            links = self._next
+            self._free = links[slot]
+            self._free_count -= 1
+            values[slot] = data
+            links[slot] = next
+        else:
+            slot = len(values)
+            values.append(data)
+            self._next.append(next)
+        return slot
+
+    def _release(self, slot: int) -> Any:
+        """
+        Internal: Return slot to the free-list and give back its value.
+        The last slot of ordered storage is dropped instead, keeping it ordered.
+        """
+        values = self._data
+        data = values[slot]
+        if self._ordered:
+            if slot == len(values) - 1:
+                values.pop()
+                self._next.pop()
+                return data
+            self._ordered = False
+        values[slot] = None
+        self._next[slot] = self._free
+        self._free = slot
+        free_count = self._free_count = self._free_count + 1
+        if not self._size:
+            self.clear()
+        elif free_count > _MAX_FREE and free_count > self._size:
+            self._compact()
+        return data
+
+    def _compact(self) -> None:
+        """
+        Internal: Rebuild storage in list order, dropping all free slots.
+        """
+        items = list(self)
+        self.clear()
+        self.extend(items)
+
+    def _slot_at(self, index: int) -> int:
+        """
+        Internal: Return slot of the node at (non-negative, valid) index.
+        Walks on from the cursor when it sits between the nearest position
+        mark and index, and leaves the cursor at index.
+        """
+        if self._ordered:
+            return index
+        pos = self._cursor_pos
+        if 0 <= index - pos < index % _MARK_STRIDE:
+            nxt = self._next
+            slot = self._cursor_slot
+            for _ in range(index - pos):
+                slot = nxt[slot]
+        else:
+            slot = self._seek(index)
+        self._cursor_pos = index
+        self._cursor_slot = slot
+        return slot
+
+    def _seek(self, index: int) -> int:
+        """
+        Internal: Return slot of the node at (non-negative, valid) index.
+        Starts from the nearest position mark, recording new marks while
+        walking past the last one.
+        """
+        nxt = self._next
+        marks = self._marks
+        mark = index // _MARK_STRIDE
+        if mark < len(marks):
+            slot = marks[mark]
+            for _ in range(index - mark * _MARK_STRIDE):
+                slot = nxt[slot]
+            return slot
+        if marks:
+            slot = marks[-1]
+            pos = (len(marks) - 1) * _MARK_STRIDE
+        else:
+            slot = self._head
+            pos = 0
+            marks.append(slot)
+        while pos + _MARK_STRIDE <= index:
+            for _ in range(_MARK_STRIDE):
+                slot = nxt[slot]
+            pos += _MARK_STRIDE
+            marks.append(slot)
+        for _ in range(index - pos):
+            slot = nxt[slot]
+        return slot
+
+    def _invalidate(self, index: int) -> None:
+        """
+        Internal: Drop position marks (and the cursor) at or after index
+        (positions shifted).
+        """
+        del self._marks[(index + _MARK_STRIDE - 1) // _MARK_STRIDE:]
+        if self._cursor_pos >= index:
+            self._cursor_pos = -1
 
     def append(self, data: Any) -> None:
         """
         Add data to the end of the list. O(1).
         """
-        node = self._Node(data)
-        if not self._head:
-            self._head = node
-            self._tail = node
+        tail = self._tail
+        slot = self._alloc(data)
+        if tail == -1:
+            self._head = slot
         else:
-            assert self._tail is not None
-            self._tail.next = node
-            self._tail = node
+            self._next[tail] = slot
+        self._tail = slot
         self._size += 1
 
     def prepend(self, data: Any) -> None:
         """
         Add data to the beginning of the list. O(1).
         """
-        node = self._Node(data, self._head)
-        self._head = node
+        slot = self._alloc(data, self._head)
+        self._head = slot
         if self._size == 0:
-            self._tail = node
+            self._tail = slot
+        else:
+            self._ordered = False
         self._size += 1
+        self._invalidate(0)
 
     def insert(self, index: int, data: Any) -> None:
         """
@@ -66,12 +196,11 @@ class SinglyLinkedList:
         if index == self._size:
             self.append(data)
             return
-        prev = self._head
-        for _ in range(index - 1):
-            prev = prev.next  # type: ignore
-        node = self._Node(data, prev.next)  # type: ignore
-        prev.next = node  # type: ignore
+        prev = self._slot_at(index - 1)
+        self._next[prev] = self._alloc(data, self._next[prev])
         self._size += 1
+        self._ordered = False
+        self._invalidate(index)
 
     def pop(self, index: int = -1) -> Any:
         """
@@ -85,45 +214,56 @@ class SinglyLinkedList:
         if index < 0 or index >= self._size:
             raise IndexError("Index out of range")
         if index == 0:
-            node = self._head
-            assert node is not None
-            self._head = node.next
+            slot = self._head
+            self._head = self._next[slot]
             if self._size == 1:
-                self._tail = None
+                self._tail = -1
             self._size -= 1
-            return node.data
-        prev = self._head
-        for _ in range(index - 1):
-            prev = prev.next  # type: ignore
-        node = prev.next  # type: ignore
-        prev.next = node.next  # type: ignore
-        if node == self._tail:
+            self._invalidate(0)
+            return self._release(slot)
+        prev = self._slot_at(index - 1)
+        slot = self._next[prev]
+        self._next[prev] = self._next[slot]
+        if slot == self._tail:
             self._tail = prev
         self._size -= 1
-        return node.data  # type: ignore
+        self._invalidate(index)
+        return self._release(slot)
 
     def remove(self, value: Any) -> None:
         """
         Remove first occurrence of value. O(n).
         Raises ValueError if not found.
         """
-        prev = None
-        curr = self._head
+        if self._ordered:
+            try:
+                index = self._data.index(value)
+            except ValueError:
+                raise ValueError(f"{value} not found in list") from None
+            self.pop(index)
+            return
+        data = self._data
+        nxt = self._next
+        prev = -1
+        slot = self._head
         idx = 0
-        while curr:
-            if curr.data == value:
-                if prev is None:
-                    self._head = curr.next
+        while slot != -1:
+            item = data[slot]
+            if item is value or item == value:
+                if prev == -1:
+                    self._head = nxt[slot]
                     if self._size == 1:
-                        self._tail = None
+                        self._tail = -1
                 else:
-                    prev.next = curr.next
-                    if curr == self._tail:
+                    nxt[prev] = nxt[slot]
+                    if slot == self._tail:
                         self._tail = prev
                 self._size -= 1
+                self._invalidate(idx)
+                self._release(slot)
                 return
-            prev = curr
-            curr = curr.next
+            prev = slot
+            slot = nxt[slot]
             idx += 1
         raise ValueError(f"{value} not found in list")
 
@@ -136,31 +276,32 @@ class SinglyLinkedList:
             index += self._size
         if index < 0 or index >= self._size:
             raise IndexError("Index out of range")
-        node = self._head
-        for _ in range(index):
-            node = node.next  # type: ignore
-        return node.data  # type: ignore
+        return self._data[self._slot_at(index)]
 
     def find(self, value: Any) -> int:
         """
         Return index of first occurrence of value, or -1 if not found. O(n).
         """
-        curr = self._head
-        idx = 0
-        while curr:
-            if curr.data == value:
-                return idx
-            curr = curr.next
-            idx += 1
-        return -1
+        try:
+            return self._data.index(value) if self._ordered else indexOf(self, value)
+        except ValueError:
+            return -1
 
     def clear(self) -> None:
         """
         Remove all elements. O(1).
         """
-        self._head = None
-        self._tail = None
+        self._data = []
+        self._next = []
+        self._head = -1
+        self._tail = -1
+        self._free = -1
+        self._free_count = 0
         self._size = 0
+        self._marks = []
+        self._cursor_pos = -1
+        self._cursor_slot = -1
+        self._ordered = True
 
     def copy(self) -> T:
         """
@@ -178,44 +319,51 @@ class SinglyLinkedList:
         """
         Support for copy.deepcopy(). O(n).
         """
-        copied = SinglyLinkedList()
-        node = self._head
-        while node:
-            copied.append(deepcopy(node.data, memo))
-            node = node.next
-        return copied
+        return SinglyLinkedList(deepcopy(self.to_list(), memo))
 
     def reverse(self) -> None:
         """
         Reverse the list in place. O(n).
         """
-        prev = None
-        curr = self._head
+        nxt = self._next
+        prev = -1
+        slot = self._head
         self._tail = self._head
-        while curr:
-            nxt = curr.next
-            curr.next = prev
-            prev = curr
-            curr = nxt
+        while slot != -1:
+            nxt[slot], prev, slot = prev, slot, nxt[slot]
         self._head = prev
+        if self._size > 1:
+            self._ordered = False
+        self._invalidate(0)
 
     def extend(self, iterable: Iterable[Any]) -> None:
         """
         Append all elements from iterable. O(n).
+        Links the new slots in one pass instead of appending one by one.
         """
-        for item in iterable:
-            self.append(item)
+        items = list(iterable)
+        n = len(items)
+        if not n:
+            return
+        start = len(self._data)
+        self._data.extend(items)
+        nxt = self._next
+        nxt.extend(range(start + 1, start + n + 1))
+        nxt[-1] = -1
+        if self._tail == -1:
+            self._head = start
+        else:
+            nxt[self._tail] = start
+        self._tail = start + n - 1
+        self._size += n
 
     def to_list(self) -> list[Any]:
         """
         Convert to Python list. O(n).
         """
-        result = []
-        node = self._head
-        while node:
-            result.append(node.data)
-            node = node.next
-        return result
+        if self._ordered:
+            return self._data[:]
+        return list(self)
 
     @classmethod
     def from_iterable(cls: Type[T], iterable: Iterable[Any]) -> T:
@@ -234,16 +382,26 @@ class SinglyLinkedList:
         """
         Iterator over elements (forward). O(n).
         """
-        node = self._head
-        while node:
-            yield node.data
-            node = node.next
+        if self._ordered:
+            return iter(self._data)
+        return self._walk()
+
+    def _walk(self) -> Iterator[Any]:
+        """
+        Internal: Generator following the links from the head.
+        """
+        data = self._data
+        nxt = self._next
+        slot = self._head
+        while slot != -1:
+            yield data[slot]
+            slot = nxt[slot]
 
     def __str__(self) -> str:
         """
         String representation. O(n).
         """
-        return f"SinglyLinkedList([{', '.join(repr(x) for x in self)}])"
+        return f"SinglyLinkedList([{', '.join(map(repr, self))}])"
 
     def __repr__(self) -> str:
         return str(self)
@@ -263,45 +421,40 @@ class SinglyLinkedList:
             index += self._size
         if index < 0 or index >= self._size:
             raise IndexError("Index out of range")
-        node = self._head
-        for _ in range(index):
-            node = node.next  # type: ignore
-        node.data = value  # type: ignore
+        self._data[self._slot_at(index)] = value
 
     def __eq__(self, other: object) -> bool:
         """
         Compare lists element-wise. O(n).
         """
+        if self is other:
+            return True
         if not isinstance(other, SinglyLinkedList):
             return False
         if self._size != other._size:
             return False
-        a = self._head
-        b = other._head
-        while a and b:
-            if a.data != b.data:
+        if self._ordered and other._ordered:
+            return self._data == other._data
+        for a, b in zip(self, other):
+            if a is not b and a != b:
                 return False
-            a = a.next
-            b = b.next
         return True
 
     def contains(self, value: Any) -> bool:
         """
         Return True if value exists. O(n).
         """
-        return self.find(value) != -1
+        if self._ordered:
+            return value in self._data
+        return value in iter(self)
 
     def count(self, value: Any) -> int:
         """
         Count occurrences of value. O(n).
         """
-        cnt = 0
-        node = self._head
-        while node:
-            if node.data == value:
-                cnt += 1
-            node = node.next
-        return cnt
+        if self._ordered:
+            return self._data.count(value)
+        return countOf(self, value)
 
     def is_empty(self) -> bool:
         """
@@ -10,80 +10,68 @@ class Stack:
     - No iterator or index-based access.
     - Comparison, copy, bulk operations, and utility methods.
     - Stores any Python object.
+
+    Elements are kept in a Python list (bottom at index 0, top at index -1).
     """
 
-    class _Node:
-        __slots__ = ('data', 'next')
-        def __init__(self, data: Any, next: Optional['Stack._Node'] = None):
-            self.data = data
-            self.next = next
+    __slots__ = ('_data', '__weakref__')
 
     def __init__(self, iterable: Optional[Iterable[Any]] = None) -> None:
         """
         Initialize an empty stack or fill from iterable (bottom to top).
         The last element of iterable becomes the top of the stack (LIFO).
         """
-        self._top: Optional[Stack._Node] = None
-        self._size: int = 0
-        if iterable is not None:
-            for item in iterable:
-                self.push(item)
+        self._data: list[Any] = [] if iterable is None else list(iterable)
 
     def push(self, data: Any) -> None:
         """
         Add data to the top of the stack.
         O(1)
         """
-        self._top = self._Node(data, self._top)
-        self._size += 1
+        self._data.append(data)
 
     def pop(self) -> Any:
         """
         Remove and return the top element. Raises IndexError if empty.
         O(1)
         """
-        if self._top is None:
-            raise IndexError("Pop from empty stack")
-        node = self._top
-        self._top = node.next
-        self._size -= 1
-        return node.data
+        try:
+            return self._data.pop()
+        except IndexError:
+            raise IndexError("Pop from empty stack") from None
 
     def peek(self) -> Any:
         """
         Return the top element without removing. Raises IndexError if empty.
         O(1)
         """
-        if self._top is None:
-            raise IndexError("Peek from empty stack")
-        return self._top.data
+        try:
+            return self._data[-1]
+        except IndexError:
+            raise IndexError("Peek from empty stack") from None
 
     def is_empty(self) -> bool:
         """
         Return True if the stack is empty.
         O(1)
         """
-        return self._size == 0
+        return not self._data
 
     def clear(self) -> None:
         """
         Remove all elements from the stack.
         O(1)
         """
-        self._top = None
-        self._size = 0
+        self._data.clear()
 
     def copy(self) -> T:
         """
         Return a shallow copy of the stack.
         O(n)
         """
-        items = []
-        node = self._top
-        while node:
-            items.append(node.data)
-            node = node.next  # type: ignore
-        return Stack(reversed(items))
+        copied = Stack.__new__(Stack)
+        copied._data = self._data[:]
+        return copied
 
     def __copy__(self) -> T:
         """
@@ -97,12 +85,9 @@ class Stack:
         Support for copy.deepcopy().
         O(n)
         """
-        items = []
-        node = self._top
-        while node:
-            items.append(deepcopy(node.data, memo))
-            node = node.next  # type: ignore
-        return Stack(reversed(items))
+        copied = Stack.__new__(Stack)
+        copied._data = deepcopy(self._data, memo)
+        return copied
 
     def extend(self, iterable: Iterable[Any]) -> None:
         """
@@ -110,8 +95,7 @@ class Stack:
         The last element of iterable becomes the top of the stack (LIFO).
         O(n)
         """
-        for item in iterable:
-            self.push(item)
+        self._data.extend(iterable)
 
     @classmethod
     def from_iterable(cls: Type[T], iterable: Iterable[Any]) -> T:
@@ -126,63 +110,42 @@ class Stack:
         Convert stack to Python list (top to bottom).
         O(n)
         """
-        items = []
-        node = self._top
-        while node:
-            items.append(node.data)
-            node = node.next  # type: ignore
-        return items
+        return self._data[::-1]
 
     def contains(self, value: Any) -> bool:
         """
         Return True if value exists in stack.
         O(n)
         """
-        node = self._top
-        while node:
-            if node.data == value:
-                return True
-            node = node.next  # type: ignore
-        return False
+        return value in self._data
 
     def count(self, value: Any) -> int:
         """
         Count occurrences of value.
         O(n)
         """
-        cnt = 0
-        node = self._top
-        while node:
-            if node.data == value:
-                cnt += 1
-            node = node.next  # type: ignore
-        return cnt
+        return self._data.count(value)
 
     def __contains__(self, value: Any) -> bool:
         """
         Return True if value exists in stack.
         O(n)
         """
-        return self.contains(value)
+        return value in self._data
 
     def __len__(self) -> int:
         """
         Return the number of elements in the stack.
         O(1)
         """
-        return self._size
+        return len(self._data)
 
     def __str__(self) -> str:
         """
         String representation.
         O(n)
         """
-        items = []
-        node = self._top
-        while node:
-            items.append(repr(node.data))
-            node = node.next  # type: ignore
-        return f"Stack([{', '.join(items)}])"
+        return f"Stack([{', '.join(map(repr, reversed(self._data)))}])"
 
     def __repr__(self) -> str:
         """
@@ -198,10 +161,4 @@ class Stack:
         """
         if not isinstance(other, Stack):
             return False
-        a, b = self._top, other._top  # type: ignore
-        while a and b:
-            if a.data != b.data:
-                return False
-            a = a.next  # type: ignore
-            b = b.next  # type: ignore
-        return a is None and b is None
\ No newline at end of file
+        return self._data == other._data
\ No newline at end of file
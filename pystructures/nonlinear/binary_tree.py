@@ -1,5 +1,6 @@
-from typing import Any, Optional, Iterable, Iterator, TypeVar, Type, Tuple, Deque
-from collections import deque
+from typing import Any, Callable, Optional, Iterable, Iterator, TypeVar, Type, Tuple
+from itertools import zip_longest
+from operator import countOf, indexOf
 from copy import deepcopy
 
 T = TypeVar("T", bound="BinaryTree")
@@ -8,6 +9,10 @@ class BinaryTree:
     """
     Classic binary tree with no ordering constraint.
     Supports arbitrary insertions, traversals, copying, comparison, bulk and utility operations.
+
+    Results of the shape queries (is_full, is_perfect, is_complete,
+    is_balanced, is_degenerate, height) are cached in `_cache` until the
+    next structural change made through the tree's methods.
     """
 
     class _Node:
@@ -24,6 +29,7 @@ class BinaryTree:
         """
         self._root: Optional["_Node"] = None
         self._size: int = 0
+        self._cache: dict[str, Any] = {}
         if iterable is not None:
             items = list(iterable)
             self._root = self._build_level_order(items)
@@ -48,14 +54,12 @@ class BinaryTree:
         """
         if not items:
             return None
-        nodes = [self._Node(v) for v in items]
-        for i, node in enumerate(nodes):
-            left_idx = 2 * i + 1
-            right_idx = 2 * i + 2
-            if left_idx < len(nodes):
-                node.left = nodes[left_idx]
-            if right_idx < len(nodes):
-                node.right = nodes[right_idx]
+        nodes = list(map(self._Node, items))
+        # Implicit layout: children of nodes[i] are nodes[2i + 1] and nodes[2i + 2].
+        for parent, child in zip(nodes, nodes[1::2]):
+            parent.left = child
+        for parent, child in zip(nodes, nodes[2::2]):
+            parent.right = child
         return nodes[0]
 
     def insert_left(self, parent: "_Node", value: Any) -> "_Node":
@@ -66,6 +70,7 @@ class BinaryTree:
         node = self._Node(value)
         parent.left = node
         self._size += 1
+        self._cache.clear()
         return node
 
     def insert_right(self, parent: "_Node", value: Any) -> "_Node":
@@ -76,6 +81,7 @@ class BinaryTree:
         node = self._Node(value)
         parent.right = node
         self._size += 1
+        self._cache.clear()
         return node
 
     def root(self) -> Optional["_Node"]:
@@ -99,6 +105,7 @@ class BinaryTree:
         """
         self._root = None
         self._size = 0
+        self._cache.clear()
 
     def copy(self: T) -> T:
         """
@@ -127,9 +134,19 @@ class BinaryTree:
         Compare trees element-wise and structure-wise.
         O(n)
         """
+        if self is other:
+            return True
         if not isinstance(other, BinaryTree):
             return False
-        return self.to_list("levelorder") == other.to_list("levelorder")
+        # Walk both trees in lockstep and stop at the first difference; the
+        # sentinel pads the shorter walk.  (_size is not trusted here:
+        # insert_left/insert_right over an existing child still count it.)
+        missing = object()
+        pairs = zip_longest(self.traverse("levelorder"), other.traverse("levelorder"), fillvalue=missing)
+        for a, b in pairs:
+            if a is not b and a != b:
+                return False
+        return True
 
     def __len__(self) -> int:
         """
@@ -145,10 +162,12 @@ class BinaryTree:
         """
         if not self._root:
             return None
-        queue: Deque["_Node"] = deque([self._root])
-        while queue:
-            node = queue.popleft()
-            if node.data == value:
+        # Level-order walk over a plain list: the for loop also visits the
+        # nodes appended behind it, so nothing is ever dequeued.
+        queue: list["_Node"] = [self._root]
+        for node in queue:
+            data = node.data
+            if data is value or data == value:
                 return node
             if node.left:
                 queue.append(node.left)
@@ -161,26 +180,16 @@ class BinaryTree:
         Return index of first occurrence of value in level-order traversal, or -1 if not found.
         O(n)
         """
-        if not self._root:
+        try:
+            return indexOf(self.traverse("levelorder"), value)
+        except ValueError:
             return -1
-        queue: Deque["_Node"] = deque([self._root])
-        idx = 0
-        while queue:
-            node = queue.popleft()
-            if node.data == value:
-                return idx
-            idx += 1
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
-        return -1
 
     def contains(self, value: Any) -> bool:
         """
         Return True if value exists in the tree. O(n)
         """
-        return self.find(value) is not None
+        return value in self.traverse("levelorder")
 
     def __contains__(self, value: Any) -> bool:
         """
@@ -193,38 +202,41 @@ class BinaryTree:
         Count occurrences of value in the tree.
         O(n)
         """
-        return sum(1 for x in self.traverse("levelorder") if x == value)
+        return countOf(self.traverse("levelorder"), value)
 
     def extend(self, iterable: Iterable[Any]) -> None:
         """
         Add all elements from iterable to the tree in level-order fashion.
-        O(k * n), where k = number of new items, n = current size.
-        """
-        for value in iterable:
-            self._add_level_order(value)
-            self._size += 1
-
-    def _add_level_order(self, value: Any) -> None:
+        Each value takes the first free child position in level order.
+        O(n + k), where k = number of new items, n = current size.
         """
-        Insert value at the first available position in level-order (BFS).
-        """
-        node = self._Node(value)
-        if self._root is None:
-            self._root = node
+        items = list(iterable)
+        if not items:
             return
-        queue: Deque["_Node"] = deque([self._root])
-        while queue:
-            curr = queue.popleft()
+        self._cache.clear()
+        Node = self._Node
+        i = 0
+        if self._root is None:
+            self._root = Node(items[0])
+            i = 1
+        # A single BFS that fills every free slot as it reaches it visits the
+        # same positions, in the same order, as one BFS per inserted value.
+        queue: list["_Node"] = [self._root]
+        n = len(items)
+        for curr in queue:
+            if i == n:
+                break
             if curr.left is None:
-                curr.left = node
-                return
-            else:
-                queue.append(curr.left)
+                curr.left = Node(items[i])
+                i += 1
+            queue.append(curr.left)
             if curr.right is None:
-                curr.right = node
-                return
-            else:
-                queue.append(curr.right)
+                if i == n:
+                    break
+                curr.right = Node(items[i])
+                i += 1
+            queue.append(curr.right)
+        self._size += n
 
     def remove(self, value: Any) -> None:
         """
@@ -236,44 +248,35 @@ class BinaryTree:
         if not self._root:
             raise ValueError(f"{value} not found in tree")
 
-        queue: Deque[Tuple["_Node", Optional["_Node"]]] = deque([(self._root, None)])
-        target: Optional["_Node"] = None
-        target_parent: Optional["_Node"] = None
-        deepest: Optional["_Node"] = None
-        deepest_parent: Optional["_Node"] = None
-
-        while queue:
-            node, parent = queue.popleft()
-            if node.data == value and target is None:
-                target = node
-                target_parent = parent
+        # One level-order pass (the loop also visits nodes appended to the
+        # list as it goes); parents[i] is the index of nodes[i]'s parent.
+        nodes: list["_Node"] = [self._root]
+        parents: list[int] = [-1]
+        for i, node in enumerate(nodes):
             if node.left:
-                queue.append((node.left, node))
+                nodes.append(node.left)
+                parents.append(i)
             if node.right:
-                queue.append((node.right, node))
-            deepest = node
-            deepest_parent = parent
-
-        if not target:
-            raise ValueError(f"{value} not found in tree")
-
-        if deepest is target:
-            if target_parent is None:
-                self._root = None
-            else:
-                if target_parent.left is target:
-                    target_parent.left = None
-                else:
-                    target_parent.right = None
-            self._size -= 1
-            return
-
-        target.data = deepest.data
-        if deepest_parent.left is deepest:
-            deepest_parent.left = None
+                nodes.append(node.right)
+                parents.append(i)
+        try:
+            idx = [node.data for node in nodes].index(value)
+        except ValueError:
+            raise ValueError(f"{value} not found in tree") from None
+
+        target = nodes[idx]
+        deepest = nodes[-1]
+        if deepest is not target:
+            target.data = deepest.data
+        parent = parents[-1]
+        if parent == -1:
+            self._root = None
+        elif nodes[parent].left is deepest:
+            nodes[parent].left = None
         else:
-            deepest_parent.right = None
+            nodes[parent].right = None
         self._size -= 1
+        self._cache.clear()
 
     def to_list(self, order: str = "inorder") -> list[Any]:
         """
@@ -307,31 +310,46 @@ class BinaryTree:
         else:
             raise ValueError(f"Unknown traversal order: {order}")
 
-    def _inorder(self, node: "_Node") -> Iterator[Any]:
-        if node.left:
-            yield from self._inorder(node.left)
-        yield node.data
-        if node.right:
-            yield from self._inorder(node.right)
+    def _inorder(self, node: Optional["_Node"]) -> Iterator[Any]:
+        stack: list["_Node"] = []
+        while True:
+            while node:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            yield node.data
+            node = node.right
 
     def _preorder(self, node: "_Node") -> Iterator[Any]:
-        yield node.data
-        if node.left:
-            yield from self._preorder(node.left)
-        if node.right:
-            yield from self._preorder(node.right)
-
-    def _postorder(self, node: "_Node") -> Iterator[Any]:
-        if node.left:
-            yield from self._postorder(node.left)
-        if node.right:
-            yield from self._postorder(node.right)
-        yield node.data
+        stack: list["_Node"] = [node]
+        while stack:
+            node = stack.pop()
+            yield node.data
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def _postorder(self, node: Optional["_Node"]) -> Iterator[Any]:
+        stack: list["_Node"] = []
+        last: Optional["_Node"] = None
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+                continue
+            top = stack[-1]
+            if top.right and top.right is not last:
+                node = top.right
+            else:
+                yield top.data
+                last = stack.pop()
 
     def _levelorder(self, node: "_Node") -> Iterator[Any]:
-        queue: Deque["_Node"] = deque([node])
-        while queue:
-            curr = queue.popleft()
+        queue: list["_Node"] = [node]
+        for curr in queue:
             yield curr.data
             if curr.left:
                 queue.append(curr.left)
@@ -339,17 +357,14 @@ class BinaryTree:
                 queue.append(curr.right)
 
     def _reverselevelorder(self, node: "_Node") -> Iterator[Any]:
-        queue: Deque["_Node"] = deque([node])
-        stack: list[Any] = []
-        while queue:
-            curr = queue.popleft()
-            stack.append(curr.data)
+        queue: list["_Node"] = [node]
+        for curr in queue:
             if curr.right:
                 queue.append(curr.right)
             if curr.left:
                 queue.append(curr.left)
-        while stack:
-            yield stack.pop()
+        for curr in reversed(queue):
+            yield curr.data
 
     def _boundary(self, node: "_Node") -> Iterator[Any]:
         curr = node
@@ -373,15 +388,13 @@ class BinaryTree:
             yield d
 
     def _diagonal(self, node: "_Node") -> Iterator[Any]:
-        def helper(queue: list["_Node"]):
-            while queue:
-                curr = queue.pop(0)
-                while curr:
-                    yield curr.data
-                    if curr.left:
-                        queue.append(curr.left)
-                    curr = curr.right
-        return helper([node])
+        queue: list["_Node"] = [node]
+        for curr in queue:
+            while curr:
+                yield curr.data
+                if curr.left:
+                    queue.append(curr.left)
+                curr = curr.right
 
     def __iter__(self) -> Iterator[Any]:
         """
@@ -399,6 +412,16 @@ class BinaryTree:
     def __repr__(self) -> str:
         return str(self)
 
+    def _cached(self, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Internal: Return the cached result of a shape query, computing it on first use.
+        """
+        try:
+            return self._cache[name]
+        except KeyError:
+            result = self._cache[name] = compute()
+            return result
+
     def is_full(self) -> bool:
         """
         Return True if tree is full (every node has 0 or 2 children).
@@ -410,7 +433,7 @@ class BinaryTree:
             if bool(node.left) != bool(node.right):
                 return False
             return _full(node.left) and _full(node.right)
-        return _full(self._root)
+        return self._cached("is_full", lambda: _full(self._root))
 
     def is_perfect(self) -> bool:
         """
@@ -431,33 +454,33 @@ class BinaryTree:
             if not node.left or not node.right:
                 return False
             return _perfect(node.left, depth, level+1) and _perfect(node.right, depth, level+1)
-        d = _depth(self._root)
-        return _perfect(self._root, d)
+        return self._cached("is_perfect", lambda: _perfect(self._root, _depth(self._root)))
 
     def is_complete(self) -> bool:
         """
         Return True if tree is complete (all levels except last are full, last level filled left to right).
         O(n)
         """
-        if not self._root:
+        def _complete() -> bool:
+            if not self._root:
+                return True
+            queue: list["_Node"] = [self._root]
+            end = False
+            for node in queue:
+                if node.left:
+                    if end:
+                        return False
+                    queue.append(node.left)
+                else:
+                    end = True
+                if node.right:
+                    if end:
+                        return False
+                    queue.append(node.right)
+                else:
+                    end = True
             return True
-        queue: Deque["_Node"] = deque([self._root])
-        end = False
-        while queue:
-            node = queue.popleft()
-            if node.left:
-                if end:
-                    return False
-                queue.append(node.left)
-            else:
-                end = True
-            if node.right:
-                if end:
-                    return False
-                queue.append(node.right)
-            else:
-                end = True
-        return True
+        return self._cached("is_complete", _complete)
 
     def is_balanced(self) -> bool:
         """
@@ -471,7 +494,7 @@ class BinaryTree:
             right_bal, right_h = _balanced(node.right)
             balanced = left_bal and right_bal and abs(left_h - right_h) <= 1
             return balanced, 1 + max(left_h, right_h)
-        return _balanced(self._root)[0]
+        return self._cached("is_balanced", lambda: _balanced(self._root)[0])
 
     def is_degenerate(self) -> bool:
         """
@@ -484,7 +507,7 @@ class BinaryTree:
             if node.left and node.right:
                 return False
             return _degenerate(node.left) and _degenerate(node.right)
-        return _degenerate(self._root)
+        return self._cached("is_degenerate", lambda: _degenerate(self._root))
 
     def height(self) -> int:
         """
@@ -495,20 +518,43 @@ class BinaryTree:
             if not node:
                 return -1
             return 1 + max(_height(node.left), _height(node.right))
-        return _height(self._root)
+        return self._cached("height", lambda: _height(self._root))
 
     def balance(self) -> None:
         """
         Balance tree by rebuilding as complete binary tree from inorder traversal.
         O(n)
         """
-        items = self.to_list("inorder")
-        def build(items: list[Any]) -> Optional["_Node"]:
-            if not items:
-                return None
-            mid = len(items) // 2
-            root = self._Node(items[mid])
-            root.left = build(items[:mid])
-            root.right = build(items[mid+1:])
-            return root
-        self._root = build(items)
\ No newline at end of file
+        # Relink the existing nodes rather than allocating new ones: every
+        # node keeps its value, only its children change.
+        nodes: list["_Node"] = []
+        stack: list["_Node"] = []
+        node = self._root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            nodes.append(node)
+            node = node.right
+        # Hang the middle of each index range under its parent, working from
+        # an explicit stack of (lo, hi, parent, is_left) so the depth of the
+        # old tree never matters.
+        self._root = None
+        ranges: list[Tuple[int, int, Optional["_Node"], bool]] = [(0, len(nodes), None, False)]
+        while ranges:
+            lo, hi, parent, is_left = ranges.pop()
+            if lo < hi:
+                mid = (lo + hi) // 2
+                child = nodes[mid]
+                ranges.append((mid + 1, hi, child, False))
+                ranges.append((lo, mid, child, True))
+            else:
+                child = None
+            if parent is None:
+                self._root = child
+            elif is_left:
+                parent.left = child
+            else:
+                parent.right = child
+        self._cache.clear()
\ No newline at end of file
@@ -1,23 +1,85 @@
-from typing import Any, Iterable, Iterator, Optional, TypeVar, Type
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar, Type
 from abc import ABC, abstractmethod
+from collections import Counter
 from copy import deepcopy
+import heapq
+import operator
+
+try:
+    from heapq import (
+        heapify_max as _heapify_max,
+        heappop_max as _heappop_max,
+        heappush_max as _heappush_max,
+        heapreplace_max as _heapreplace_max,
+    )
+except ImportError:  # Python < 3.14 ships the max-heap helpers privately
+    from heapq import _heapify_max, _heappop_max, _heapreplace_max, _siftdown_max
+
+    def _heappush_max(heap: list[Any], item: Any) -> None:
+        """Push item onto a max-heap list (stand-in for heapq.heappush_max)."""
+        heap.append(item)
+        _siftdown_max(heap, 0, len(heap) - 1)
 
 __all__ = ["MaxHeap", "MinHeap"]
 
 T = TypeVar("T", bound="_Heap")
 
+# Types that copy.deepcopy returns unchanged.
+_ATOMIC_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes})
+
+# Queries an unchanged heap must answer by scanning before a hash-based
+# cache of its elements is built.
+_CACHE_AFTER = 8
+
+# `_members` value for heaps whose elements cannot be hashed.
+_UNHASHABLE = object()
+
 class _Heap(ABC):
     """
     Internal base class for MaxHeap/MinHeap.
     Implements core heap operations with a Pythonic API.
     Not for direct use.
+
+    The sift-based push/pop/pushpop/replace/heapify below order elements
+    by _compare. MaxHeap and MinHeap replace them with heapq calls, and
+    __init_subclass__ restores them for subclasses that override _compare.
+
+    Membership tests and count() scan the list. `_queries` counts those
+    answered since the last change; once it reaches _CACHE_AFTER, a set
+    (for `in`) or Counter (for count(), also used by `in`) of the elements
+    is built and kept in `_members`, or `_members` is set to _UNHASHABLE
+    if the elements cannot be hashed. Every push, pop, pushpop, replace,
+    extend, heapify and clear resets `_members` to None and `_queries`
+    to 0.
     """
 
+    __slots__ = ('_data', '_members', '_queries', '__weakref__')
+
+    # Methods a concrete heap may implement with heapq routines, which are
+    # only valid while _compare is the ordering heapq uses (`_heapq_compare`).
+    _HEAPQ_METHODS = ('push', 'pop', 'pushpop', 'replace', 'heapify', '_push_each')
+    _heapq_compare: Optional[Callable[[Any, Any], bool]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Route subclasses that override _compare back to the generic sift.
+        Heapq-based methods the subclass does not define itself are replaced
+        with the _Heap versions, which order elements by _compare.
+        """
+        super().__init_subclass__(**kwargs)
+        if cls._heapq_compare is not None and cls._compare is not cls._heapq_compare:
+            for name in _Heap._HEAPQ_METHODS:
+                if name not in cls.__dict__:
+                    setattr(cls, name, getattr(_Heap, name))
+            cls._heapq_compare = None
+
     def __init__(self, iterable: Optional[Iterable[Any]] = None) -> None:
         """
         Initialize an empty heap, or bulk-load from iterable.
         """
         self._data: list[Any] = []
+        self._members: Optional[Any] = None
+        self._queries: int = 0
         if iterable is not None:
             self.heapify(iterable)
 
@@ -25,6 +87,8 @@ class _Heap(ABC):
         """
         Add a new item to the heap. O(log n).
         """
+        self._members = None
+        self._queries = 0
         self._data.append(item)
         self._sift_up(len(self._data) - 1)
 
@@ -35,6 +99,8 @@ class _Heap(ABC):
         """
         if not self._data:
             raise IndexError("Pop from empty heap")
+        self._members = None
+        self._queries = 0
         root = self._data[0]
         last = self._data.pop()
         if self._data:
@@ -51,18 +117,54 @@ class _Heap(ABC):
             raise IndexError("Peek from empty heap")
         return self._data[0]
 
+    def pushpop(self, item: Any) -> Any:
+        """
+        Push item, then pop and return the root, with a single sift.
+        Returns item itself if it would be the new root. O(log n).
+        """
+        data = self._data
+        if data and self._compare(data[0], item):
+            self._members = None
+            self._queries = 0
+            item, data[0] = data[0], item
+            self._sift_down(0)
+        return item
+
+    def replace(self, item: Any) -> Any:
+        """
+        Pop and return the root, then push item, with a single sift.
+        The returned element may be worse than item.
+        Raises IndexError if heap is empty. O(log n).
+        """
+        if not self._data:
+            raise IndexError("Replace on empty heap")
+        self._members = None
+        self._queries = 0
+        root = self._data[0]
+        self._data[0] = item
+        self._sift_down(0)
+        return root
+
     def extend(self, iterable: Iterable[Any]) -> None:
         """
-        Add all items from iterable to heap, one by one. O(k log n).
+        Add all items from iterable to heap. O(k log n).
+        When the new items outnumber the current ones the heap is rebuilt
+        in bulk instead, O(n + k).
         """
-        for item in iterable:
-            self.push(item)
+        items = list(iterable)
+        if len(items) > len(self._data):
+            self._data.extend(items)
+            self.heapify(self._data)
+            return
+        self._push_each(items)
 
     def heapify(self, iterable: Iterable[Any]) -> None:
         """
         Bulk-load heap from iterable, efficiently. O(n).
         Replaces current contents.
         """
+        self._members = None
+        self._queries = 0
         self._data = list(iterable)
         n = len(self._data)
         for i in reversed(range(n // 2)):
@@ -79,13 +181,25 @@ class _Heap(ABC):
         """
         Remove all elements from heap. O(1).
         """
+        self._members = None
+        self._queries = 0
         self._data.clear()
 
+    @classmethod
+    def _wrap(cls: Type[T], data: list[Any]) -> T:
+        """
+        Internal: Create a heap around a list that is already in heap order.
+        The list is adopted as-is, without copying or heapifying. O(1).
+        """
+        heap = cls()
+        heap._data = data
+        return heap
+
     def copy(self) -> "T":
         """
         Return a shallow copy of the heap. O(n).
         """
-        return self.__class__(self._data)
+        return self._wrap(self._data[:])
 
     def __copy__(self: T) -> T:
         """Support for copy.copy(). O(n)."""
@@ -93,14 +207,17 @@ class _Heap(ABC):
 
     def __deepcopy__(self: T, memo) -> T:
         """Support for copy.deepcopy(). O(n)."""
-        copied_data = deepcopy(self._data, memo)
-        return self.__class__(copied_data)
+        data = self._data
+        if set(map(type, data)) <= _ATOMIC_TYPES:
+            # deepcopy would return every element unchanged: copy the list only.
+            return self._wrap(data[:])
+        return self._wrap(deepcopy(data, memo))
 
     def to_list(self) -> list[Any]:
         """
         Return list of all elements (internal order). O(n).
         """
-        return list(self._data)
+        return self._data[:]
 
     def __len__(self) -> int:
         """
@@ -122,20 +239,57 @@ class _Heap(ABC):
 
     def __contains__(self, item: Any) -> bool:
         """
-        Return True if item is in heap. O(n).
+        Return True if item is in heap.
+        O(n), or O(1) average after repeated tests on an unchanged heap.
         """
+        members = self._element_cache(set)
+        if members is not None:
+            try:
+                return item in members
+            except TypeError:  # unhashable item
+                pass
         return item in self._data
 
     def count(self, item: Any) -> int:
         """
-        Return number of occurrences of item. O(n).
+        Return number of occurrences of item.
+        O(n), or O(1) average after repeated queries on an unchanged heap.
         """
+        counts = self._element_cache(Counter)
+        if counts is not None:
+            try:
+                return counts[item]
+            except TypeError:  # unhashable item
+                pass
         return self._data.count(item)
 
+    def _element_cache(self, kind: type) -> Optional[Any]:
+        """
+        Internal: Return the cached set or Counter (kind) of the elements,
+        or None while queries should scan `_data`.
+        """
+        members = self._members
+        if members is None:
+            queries = self._queries = self._queries + 1
+            if queries < _CACHE_AFTER:
+                return None
+        elif members is _UNHASHABLE:
+            return None
+        elif isinstance(members, (kind, Counter)):
+            return members
+        try:
+            members = self._members = kind(self._data)
+        except TypeError:  # unhashable elements: keep scanning the list
+            self._members = _UNHASHABLE
+            return None
+        return members
+
     def __eq__(self, other: object) -> bool:
         """
         Compare heaps by their contents (internal order). O(n).
         """
+        if self is other:
+            return True
         if not isinstance(other, _Heap):
             return False
         return self._data == other._data
@@ -152,75 +306,215 @@ class _Heap(ABC):
         """
         return str(self)
 
-    @staticmethod
-    def _parent(index: int) -> int:
-        """
-        Return parent index for given index.
-        """
-        return (index - 1) // 2
-
-    @staticmethod
-    def _left(index: int) -> int:
-        """
-        Return left child index for given index.
-        """
-        return 2 * index + 1
-
-    @staticmethod
-    def _right(index: int) -> int:
+    def _push_each(self, items: list[Any]) -> None:
         """
-        Return right child index for given index.
+        Internal: Push a batch of items one by one, without a push() call per item.
         """
-        return 2 * index + 2
+        self._members = None
+        self._queries = 0
+        data = self._data
+        sift_up = self._sift_up
+        for item in items:
+            data.append(item)
+            sift_up(len(data) - 1)
 
-    def _sift_up(self, index: int) -> None:
-        """
-        Restore heap property up from index.
-        """
-        while index > 0:
-            parent = self._parent(index)
-            if self._compare(self._data[index], self._data[parent]):
-                self._data[index], self._data[parent] = self._data[parent], self._data[index]
-                index = parent
-            else:
+    def _sift_up(self, index: int, start: int = 0) -> None:
+        """
+        Restore heap property up from index, stopping at start.
+        Parents are shifted down into the hole and the item is stored once.
+        """
+        data = self._data
+        compare = self._compare
+        item = data[index]
+        while index > start:
+            parent = (index - 1) >> 1
+            parent_item = data[parent]
+            if not compare(item, parent_item):
                 break
+            data[index] = parent_item
+            index = parent
+        data[index] = item
 
     def _sift_down(self, index: int) -> None:
         """
         Restore heap property down from index.
-        """
-        n = len(self._data)
-        while True:
-            left = self._left(index)
-            right = self._right(index)
-            best = index
-            if left < n and self._compare(self._data[left], self._data[best]):
-                best = left
-            if right < n and self._compare(self._data[right], self._data[best]):
-                best = right
-            if best == index:
-                break
-            self._data[index], self._data[best] = self._data[best], self._data[index]
-            index = best
+        The hole is moved all the way down to a leaf, promoting the better
+        child at each level, and the item is then sifted back up from there
+        (as heapq does). The item usually belongs near the bottom, so this
+        needs fewer comparisons than stopping as soon as it fits.
+        """
+        data = self._data
+        compare = self._compare
+        n = len(data)
+        start = index
+        item = data[index]
+        child = 2 * index + 1
+        while child < n:
+            right = child + 1
+            if right < n and compare(data[right], data[child]):
+                child = right
+            data[index] = data[child]
+            index = child
+            child = 2 * index + 1
+        data[index] = item
+        self._sift_up(index, start)
 
     @abstractmethod
     def _compare(self, a: Any, b: Any) -> bool:
         """
         Compare two elements for heap property.
-        Must be implemented in subclass.
+        Must be implemented in subclass, ideally as a C comparison such as
+        staticmethod(operator.lt) so the sift loops avoid a Python frame per call.
         """
         pass
 
 class MaxHeap(_Heap):
     """
     MaxHeap: root is always the largest element.
+    Push, pop, replace and bulk build use the max-heap helpers from heapq
+    (all in C from Python 3.14; push falls back to heapq's Python sift before that).
+    Subclasses that override _compare use the generic _Heap sift instead.
     """
-    def _compare(self, a: Any, b: Any) -> bool:
-        return a > b
+
+    __slots__ = ()
+
+    def push(self, item: Any) -> None:
+        """
+        Add a new item to the heap. O(log n).
+        """
+        self._members = None
+        self._queries = 0
+        _heappush_max(self._data, item)
+
+    def pop(self) -> Any:
+        """
+        Remove and return the largest element.
+        Raises IndexError if heap is empty. O(log n).
+        """
+        self._members = None
+        self._queries = 0
+        try:
+            return _heappop_max(self._data)
+        except IndexError:
+            raise IndexError("Pop from empty heap") from None
+
+    def pushpop(self, item: Any) -> Any:
+        """
+        Push item, then pop and return the largest element, with a single sift.
+        O(log n).
+        """
+        data = self._data
+        if data and data[0] > item:
+            self._members = None
+            self._queries = 0
+            return _heapreplace_max(data, item)
+        return item
+
+    def replace(self, item: Any) -> Any:
+        """
+        Pop and return the largest element, then push item, with a single sift.
+        Raises IndexError if heap is empty. O(log n).
+        """
+        self._members = None
+        self._queries = 0
+        try:
+            return _heapreplace_max(self._data, item)
+        except IndexError:
+            raise IndexError("Replace on empty heap") from None
+
+    def heapify(self, iterable: Iterable[Any]) -> None:
+        """
+        Bulk-load heap from iterable, efficiently. O(n).
+        Replaces current contents.
+        """
+        self._members = None
+        self._queries = 0
+        self._data = list(iterable)
+        _heapify_max(self._data)
+
+    def _push_each(self, items: list[Any]) -> None:
+        """
+        Internal: Push a batch of items one by one, without a push() call per item.
+        """
+        self._members = None
+        self._queries = 0
+        data = self._data
+        for item in items:
+            _heappush_max(data, item)
+
+    _compare = staticmethod(operator.gt)
+    _heapq_compare = operator.gt
 
 class MinHeap(_Heap):
     """
     MinHeap: root is always the smallest element.
+    Push, pop, pushpop, replace and bulk build are the C heapq routines.
+    Subclasses that override _compare use the generic _Heap sift instead.
     """
-    def _compare(self, a: Any, b: Any) -> bool:
-        return a < b
\ No newline at end of file
+
+    __slots__ = ()
+
+    def push(self, item: Any) -> None:
+        """
+        Add a new item to the heap. O(log n).
+        """
+        self._members = None
+        self._queries = 0
+        heapq.heappush(self._data, item)
+
+    def pop(self) -> Any:
+        """
+        Remove and return the smallest element.
+        Raises IndexError if heap is empty. O(log n).
+        """
+        self._members = None
+        self._queries = 0
+        try:
+            return heapq.heappop(self._data)
+        except IndexError:
+            raise IndexError("Pop from empty heap") from None
+
+    def pushpop(self, item: Any) -> Any:
+        """
+        Push item, then pop and return the smallest element, with a single sift.
+        O(log n).
+        """
+        self._members = None
+        self._queries = 0
+        return heapq.heappushpop(self._data, item)
+
+    def replace(self, item: Any) -> Any:
+        """
+        Pop and return the smallest element, then push item, with a single sift.
+        Raises IndexError if heap is empty. O(log n).
+        """
+        self._members = None
+        self._queries = 0
+        try:
+            return heapq.heapreplace(self._data, item)
+        except IndexError:
+            raise IndexError("Replace on empty heap") from None
+
+    def heapify(self, iterable: Iterable[Any]) -> None:
+        """
+        Bulk-load heap from iterable, efficiently. O(n).
+        Replaces current contents.
+        """
+        self._members = None
+        self._queries = 0
+        self._data = list(iterable)
+        heapq.heapify(self._data)
+
+    def _push_each(self, items: list[Any]) -> None:
+        """
+        Internal: Push a batch of items one by one, without a push() call per item.
+        """
+        self._members = None
+        self._queries = 0
+        data = self._data
+        heappush = heapq.heappush
+        for item in items:
+            heappush(data, item)
+
+    _compare = staticmethod(operator.lt)
+    _heapq_compare = operator.lt
@@ -1,9 +1,19 @@
 from typing import Any, Optional, Iterable, Iterator, Callable, TypeVar, Type
 from copy import deepcopy
-from .heap import MaxHeap, MinHeap
+from heapq import nlargest, nsmallest
+from operator import countOf, eq, itemgetter
+from .heap import MaxHeap, MinHeap, _ATOMIC_TYPES
 
 T = TypeVar("T", bound="PriorityQueue")
 
+# value and (priority, value) from a (priority, insertion_index, value) entry.
+_value = itemgetter(2)
+_pair = itemgetter(0, 2)
+
+# Halves of a (priority, value) pair passed to extend().
+_first = itemgetter(0)
+_second = itemgetter(1)
+
 class PriorityQueue:
     """
     PriorityQueue: classic stable priority queue built atop MinHeap/MaxHeap.
@@ -11,8 +21,14 @@ class PriorityQueue:
     - Custom key function supported for extracting priority from value.
     - O(log n) push/pop, O(1) peek, bulk and utility methods, rich comparison, copy/deepcopy, from_iterable.
     - Accepts any mutually comparable priority type; value can be any Python object.
+
+    remove() is lazy: it records the entry's insertion index in `_removed`
+    and the entry stays in the heap until it reaches the top (or until the
+    dead entries outnumber the live ones and the heap is rebuilt).
     """
 
+    __slots__ = ('_ascending', '_heap', '_key', '_counter', '_removed', '__weakref__')
+
     def __init__(
         self,
         iterable: Optional[Iterable[Any]] = None,
@@ -25,9 +41,11 @@ class PriorityQueue:
         :param ascending: If True, lowest priority dequeued first (MinHeap); else highest (MaxHeap).
         :param key: Optional function to extract priority from value (if not given as pair).
         """
+        self._ascending = ascending
         self._heap = MinHeap() if ascending else MaxHeap()
         self._key = key
         self._counter = 0
+        self._removed: set[int] = set()
         if iterable is not None:
             self.extend(iterable)
 
@@ -43,9 +61,9 @@ class PriorityQueue:
             if self._key is None:
                 raise ValueError("Either 'priority' or 'key' must be provided")
             priority = self._key(value)
-        item = (priority, self._counter, value)
-        self._heap.push(item)
-        self._counter += 1
+        counter = self._counter
+        self._heap.push((priority, counter, value))
+        self._counter = counter + 1
 
     def pop(self) -> Any:
         """
@@ -53,6 +71,8 @@ class PriorityQueue:
         O(log n)
         :raises IndexError: If queue is empty.
         """
+        if self._removed:
+            self._drop_removed_top()
         _, _, value = self._heap.pop()
         return value
 
@@ -62,6 +82,8 @@ class PriorityQueue:
         O(log n)
         :raises IndexError: If queue is empty.
         """
+        if self._removed:
+            self._drop_removed_top()
         priority, _, value = self._heap.pop()
         return (priority, value)
 
@@ -71,6 +93,8 @@ class PriorityQueue:
         O(1)
         :raises IndexError: If queue is empty.
         """
+        if self._removed:
+            self._drop_removed_top()
         _, _, value = self._heap.peek()
         return value
 
@@ -80,57 +104,139 @@ class PriorityQueue:
         O(1)
         :raises IndexError: If queue is empty.
         """
+        if self._removed:
+            self._drop_removed_top()
         priority, _, value = self._heap.peek()
         return (priority, value)
 
+    def ntop(self, k: int) -> list[Any]:
+        """
+        Return the k values that would be dequeued first, in dequeue order,
+        without removing them.
+        O(n log k)
+        """
+        select = nsmallest if self._ascending else nlargest
+        return list(map(_value, select(k, self._entries())))
+
     def clear(self) -> None:
         """
         Remove all elements from the queue. O(1)
         """
         self._heap.clear()
         self._counter = 0
+        self._removed.clear()
+
+    def remove(self, value: Any) -> None:
+        """
+        Remove the occurrence of value that would be dequeued first.
+        The entry is only marked as removed; it leaves the heap lazily.
+        O(n) to find the value, amortized O(log n) to drop the entry.
+        :raises ValueError: If value is not in the queue.
+        """
+        matches = [tup for tup in self._entries() if tup[2] is value or tup[2] == value]
+        if not matches:
+            raise ValueError(f"{value!r} not in priority queue")
+        first = min if self._ascending else max
+        # Insertion indices are unique, so the values are never compared.
+        self._removed.add(first(matches)[1])
+        if len(self._removed) > len(self._heap) // 2:
+            self._compact()
+
+    def _entries(self) -> Iterator[tuple[Any, int, Any]]:
+        """
+        Internal: Iterate over the heap entries that have not been removed.
+        """
+        removed = self._removed
+        if not removed:
+            return iter(self._heap)
+        return (tup for tup in self._heap if tup[1] not in removed)
+
+    def _drop_removed_top(self) -> None:
+        """
+        Internal: Pop removed entries off the top of the heap.
+        """
+        heap = self._heap
+        removed = self._removed
+        while removed and heap and heap.peek()[1] in removed:
+            removed.discard(heap.pop()[1])
+
+    def _compact(self) -> None:
+        """
+        Internal: Rebuild the heap from the live entries. O(n)
+        """
+        self._heap.heapify(list(self._entries()))
+        self._removed.clear()
 
     def extend(self, iterable: Iterable[Any]) -> None:
         """
         Add all elements from iterable.
         Each element can be a value or (priority, value) pair.
-        O(k log n)
-        """
-        for item in iterable:
-            if (
-                isinstance(item, tuple)
-                and len(item) == 2
-                and not isinstance(item[0], (str, bytes))
-            ):
-                priority, value = item
-                self.push(value, priority)
-            else:
-                self.push(item)
+        O(k log n), or O(n + k) when the new elements outnumber the queued ones.
+        """
+        # Build every entry first and hand the batch to the heap in one call,
+        # which re-heapifies in bulk when that is cheaper than k pushes.
+        key = self._key
+        counter = self._counter
+        items = list(iterable)
+        end = counter + len(items)
+        # Uniform batches are recognised with a few C-level passes so the
+        # per-element checks below only run for mixed input.
+        entries: Optional[list[tuple[Any, int, Any]]] = None
+        kinds = set(map(type, items))
+        if key is not None and not any(issubclass(kind, tuple) for kind in kinds):
+            # No element can be a (priority, value) pair, so every priority
+            # comes from key: compute them all with a single map.
+            entries = list(zip(map(key, items), range(counter, end), items))
+        elif kinds == {tuple} and set(map(len, items)) == {2}:
+            # All 2-tuples: they are all pairs unless some first item is a
+            # string (a value) or None (priority taken from key).
+            priorities = list(map(_first, items))
+            if not any(issubclass(kind, (str, bytes, type(None))) for kind in set(map(type, priorities))):
+                entries = list(zip(priorities, range(counter, end), map(_second, items)))
+        if entries is None:
+            entries = []
+            for index, item in enumerate(items, counter):
+                if (
+                    isinstance(item, tuple)
+                    and len(item) == 2
+                    and not isinstance(item[0], (str, bytes))
+                ):
+                    priority, value = item
+                else:
+                    priority, value = None, item
+                if priority is None:
+                    if key is None:
+                        raise ValueError("Either 'priority' or 'key' must be provided")
+                    priority = key(value)
+                entries.append((priority, index, value))
+        self._heap.extend(entries)
+        self._counter = end
 
     def to_list(self) -> list[Any]:
         """
         Return list of values in queue (internal heap order).
         O(n)
         """
-        return [tup[2] for tup in self._heap.to_list()]
+        return list(map(_value, self._entries()))
 
     def to_pair_list(self) -> list[tuple[Any, Any]]:
         """
         Return [(priority, value), ...] in internal heap order.
         O(n)
         """
-        return [(tup[0], tup[2]) for tup in self._heap.to_list()]
+        return list(map(_pair, self._entries()))
 
     def copy(self: T) -> T:
         """
         Return a shallow copy of the priority queue. O(n)
         """
         copied = type(self)(
-            ascending=isinstance(self._heap, MinHeap),
+            ascending=self._ascending,
             key=self._key
         )
         copied._heap = self._heap.copy()
         copied._counter = self._counter
+        copied._removed = set(self._removed)
         return copied
 
     def __copy__(self: T) -> T:
@@ -138,13 +244,41 @@ class PriorityQueue:
 
     def __deepcopy__(self: T, memo) -> T:
         copied = type(self)(
-            ascending=isinstance(self._heap, MinHeap),
+            ascending=self._ascending,
             key=self._key
         )
-        copied._heap = deepcopy(self._heap, memo)
+        atomic = _ATOMIC_TYPES
+        heap = self._heap
+        if set(map(type, map(_first, heap))) | set(map(type, map(_value, heap))) <= atomic:
+            # Entries holding only atomic objects are immutable all the way
+            # down, so the copy can share them.
+            copied._heap = heap.copy()
+        else:
+            # Copy entry by entry: the insertion index is a plain int and the
+            # entry order is already a valid heap, so only priorities and
+            # values go through deepcopy, and atomic ones are reused as
+            # deepcopy would.
+            copied._heap = heap._wrap([
+                (
+                    priority if type(priority) in atomic else deepcopy(priority, memo),
+                    index,
+                    value if type(value) in atomic else deepcopy(value, memo),
+                )
+                for priority, index, value in heap
+            ])
         copied._counter = self._counter
+        copied._removed = set(self._removed)
         return copied
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Support for pickle, including protocols 0 and 1: the slot values by name."""
+        return {name: getattr(self, name) for name in self.__slots__ if name != '__weakref__'}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the slot values saved by __getstate__."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     @classmethod
     def from_iterable(
         cls: Type[T],
@@ -165,40 +299,44 @@ class PriorityQueue:
         """
         Count occurrences of a value in the queue. O(n)
         """
-        return sum(1 for tup in self._heap if tup[2] == value)
+        return countOf(map(_value, self._entries()), value)
 
     def __contains__(self, value: Any) -> bool:
         """
         Return True if value exists in the queue. O(n)
         """
-        return any(tup[2] == value for tup in self._heap)
+        return value in map(_value, self._entries())
 
     def __len__(self) -> int:
         """
         Return number of elements in the queue. O(1)
         """
-        return len(self._heap)
+        return len(self._heap) - len(self._removed)
 
     def is_empty(self) -> bool:
         """
         Return True if queue is empty. O(1)
         """
-        return len(self._heap) == 0
+        return len(self._heap) == len(self._removed)
 
     def __iter__(self) -> Iterator[Any]:
         """
         Iterate over values in internal heap order. O(n)
         """
-        for tup in self._heap:
-            yield tup[2]
+        return map(_value, self._entries())
 
     def __eq__(self, other: object) -> bool:
         """
         Compare queues element-wise. O(n)
         """
+        if self is other:
+            return True
         if not isinstance(other, PriorityQueue):
             return False
-        return self.to_pair_list() == other.to_pair_list()
+        if len(self) != len(other):
+            return False
+        # Compare (priority, value) pairs lazily, stopping at the first mismatch.
+        return all(map(eq, map(_pair, self._entries()), map(_pair, other._entries())))
 
     def __str__(self) -> str:
         """
@@ -161,4 +161,76 @@ def test_bulk_operations_on_empty():
     lst.extend([])
     assert lst.to_list() == []
     lst2 = DoublyLinkedList.from_iterable([])
-    assert lst2.to_list() == []
\ No newline at end of file
+    assert lst2.to_list() == []
+
+def test_indexed_access_on_long_list():
+    lst = DoublyLinkedList(range(300))
+    ref = list(range(300))
+    assert [lst[i] for i in (250, 10, 130, 299, 64, 128)] == [250, 10, 130, 299, 64, 128]
+    lst.insert(70, -1)
+    ref.insert(70, -1)
+    assert lst.pop(200) == ref.pop(200)
+    lst.remove(5)
+    ref.remove(5)
+    lst.append(300)
+    ref.append(300)
+    lst[150] = "x"
+    ref[150] = "x"
+    assert [lst[i] for i in range(len(ref))] == ref
+    assert lst.to_list() == ref
+
+def test_heavy_churn_keeps_order():
+    lst = DoublyLinkedList(range(3000))
+    ref = list(range(3000))
+    for i in range(2500):
+        idx = (i * 7) % len(ref)
+        assert lst.pop(idx) == ref.pop(idx)
+        if i % 5 == 0:
+            lst.append(i)
+            ref.append(i)
+    assert lst.to_list() == ref
+    assert len(lst) == len(ref)
+
+def test_deepcopy_shares_memo():
+    import copy
+    shared = [1]
+    lst = DoublyLinkedList([shared, shared])
+    dup = copy.deepcopy(lst)
+    assert dup == lst
+    assert dup[0] is dup[1]
+    assert dup[0] is not shared
+
+def test_sequential_insert_and_pop():
+    lst = DoublyLinkedList(range(200))
+    ref = list(range(200))
+    for i in range(100, 250):
+        lst.insert(i, -i)
+        ref.insert(i, -i)
+    for i in range(140, 100, -1):
+        assert lst.pop(i) == ref.pop(i)
+    lst.reverse()
+    ref.reverse()
+    assert [lst[i] for i in range(30, 90)] == ref[30:90]
+    assert lst.to_list() == ref
+
+def test_queries_agree_before_and_after_relinking():
+    built = DoublyLinkedList([3, 1, 2, 1])
+    relinked = DoublyLinkedList([1, 2, 1])
+    relinked.prepend(3)
+    for lst in (built, relinked):
+        assert lst.find(1) == 1
+        assert lst.count(1) == 2
+        assert 2 in lst and 4 not in lst
+        assert lst[2] == 2
+    assert built == relinked
+    built.pop()
+    relinked.remove(1)
+    relinked.append(1)
+    assert built.to_list() == [3, 1, 2]
+    assert relinked.to_list() == [3, 2, 1, 1]
+
+def test_weak_reference():
+    import weakref
+    container = DoublyLinkedList([1, 2])
+    ref = weakref.ref(container)
+    assert ref() is container
@@ -149,4 +149,10 @@ def test_deepcopy_independence():
     q2 = copy.deepcopy(q1)
     assert q1 == q2
     q2.front().append(2)
-    assert q1 != q2
\ No newline at end of file
+    assert q1 != q2
+
+def test_weak_reference():
+    import weakref
+    container = Queue([1, 2])
+    ref = weakref.ref(container)
+    assert ref() is container
@@ -143,4 +143,10 @@ def test_deepcopy_independence():
     s2 = copy.deepcopy(s1)
     assert s1 == s2
     s2.peek().append(2)
-    assert s1 != s2
\ No newline at end of file
+    assert s1 != s2
+
+def test_weak_reference():
+    import weakref
+    container = Stack([1, 2])
+    ref = weakref.ref(container)
+    assert ref() is container
@@ -189,4 +189,61 @@ def test_remove_edge_cases():
     # Removing from empty tree
     tree.clear()
     with pytest.raises(ValueError):
-        tree.remove(2)
\ No newline at end of file
+        tree.remove(2)
+
+def test_extend_fills_gaps_in_level_order():
+    tree = BinaryTree([1])
+    node = tree.insert_left(tree.root(), 2)
+    tree.insert_left(node, 3)
+    tree.extend([4, 5, 6, 7])
+    assert tree.to_list("levelorder") == [1, 2, 4, 3, 5, 6, 7]
+    assert tree.to_list("preorder") == [1, 2, 3, 5, 4, 6, 7]
+    assert len(tree) == 7
+
+def test_traversals_on_deep_tree():
+    tree = BinaryTree([0])
+    node = tree.root()
+    for i in range(1, 3000):
+        node = tree.insert_left(node, i)
+    expected = list(range(3000))
+    assert tree.to_list("preorder") == expected
+    assert tree.to_list("inorder") == expected[::-1]
+    assert tree.to_list("postorder") == expected[::-1]
+    assert tree.to_list("diagonal") == expected
+
+def test_balance_keeps_node_references():
+    tree = BinaryTree([1])
+    node = tree.root()
+    for i in range(2, 9):
+        node = tree.insert_right(node, i)
+    last = tree.find(8)
+    tree.balance()
+    assert tree.is_balanced()
+    assert tree.to_list("inorder") == list(range(1, 9))
+    assert tree.find(8) is last
+    assert len(tree) == 8
+
+def test_shape_queries_follow_mutations():
+    tree = BinaryTree([1, 2, 3])
+    assert tree.height() == 1
+    assert tree.is_perfect()
+    leaf = tree.insert_left(tree.root().left, 4)
+    assert tree.height() == 2
+    assert not tree.is_perfect()
+    tree.extend([5, 6, 7])
+    assert tree.is_perfect()
+    tree.remove(1)
+    assert not tree.is_perfect()
+    assert tree.is_complete()
+    tree.insert_right(leaf, 8)
+    assert not tree.is_complete()
+    tree.clear()
+    assert tree.height() == -1
+
+def test_find_matches_identity_like_contains():
+    nan = float("nan")
+    tree = BinaryTree([1, nan, 3])
+    assert tree.contains(nan)
+    assert tree.find_index(nan) == 1
+    assert tree.find(nan) is tree.root().left
+    assert tree.find(float("nan")) is None
@@ -1,4 +1,5 @@
 import pytest
+import operator
 from copy import copy, deepcopy
 from pystructures.nonlinear import MaxHeap, MinHeap
 
@@ -260,4 +261,118 @@ def test_typevar_self_usage():
     assert isinstance(maxh3, MaxHeap)
     assert isinstance(minh3, MinHeap)
     assert maxh2.peek() == max([1, 2, 3])
-    assert minh2.peek() == min([3, 2, 1])
\ No newline at end of file
+    assert minh2.peek() == min([3, 2, 1])
+
+def test_membership_follows_mutations():
+    h = MinHeap([5, 3, 8])
+    assert 3 in h and 4 not in h
+    h.push(4)
+    assert 4 in h
+    assert h.pop() == 3
+    assert 3 not in h
+    h.heapify([1, 2])
+    assert 5 not in h and 2 in h
+    for _ in range(10):  # enough repeats to build the cached set
+        assert 2 in h and 5 not in h
+    h.push(5)
+    assert 5 in h and h.count(5) == 1
+    h.clear()
+    assert 1 not in h
+    lists = MaxHeap([[1], [2]])
+    for _ in range(10):
+        assert [2] in lists and [3] not in lists
+    assert [1] not in MaxHeap([1, 2])
+
+def test_pushpop_and_replace():
+    maxh = MaxHeap([5, 1, 8])
+    minh = MinHeap([5, 1, 8])
+    assert maxh.pushpop(3) == 8
+    assert maxh.pushpop(9) == 9
+    assert minh.pushpop(3) == 1
+    assert minh.pushpop(0) == 0
+    assert 3 in maxh and 3 in minh
+    assert maxh.replace(0) == 5
+    assert minh.replace(9) == 3
+    assert sorted(maxh.to_list()) == [0, 1, 3]
+    assert sorted(minh.to_list()) == [5, 8, 9]
+    assert MaxHeap().pushpop(4) == 4
+    with pytest.raises(IndexError):
+        MinHeap().replace(1)
+    with pytest.raises(IndexError):
+        MaxHeap().replace(1)
+
+def test_count_follows_mutations():
+    h = MinHeap([3, 1, 3, 2])
+    for _ in range(10):  # enough repeats to build the cached Counter
+        assert h.count(3) == 2 and h.count(7) == 0
+    assert 2 in h
+    h.push(3)
+    assert h.count(3) == 3
+    h.pop()
+    assert h.count(1) == 0 and 1 not in h
+    assert h.count([1]) == 0
+    lists = MaxHeap([[1], [2], [1]])
+    assert lists.count([1]) == 2 and [2] in lists
+
+def test_deepcopy_atomic_and_nested_items():
+    h = MinHeap([3, 1.5, 2])
+    d = deepcopy(h)
+    assert d == h and d._data is not h._data
+    d.push(0)
+    assert h.peek() == 1.5
+    nested = MaxHeap([(1, [2]), (0, [1])])
+    nd = deepcopy(nested)
+    nd.peek()[1].append(3)
+    assert nested.peek() == (1, [2])
+
+def test_subclass_compare_override():
+    class Reversed(MinHeap):
+        _compare = staticmethod(operator.gt)
+
+    class ByAbs(MaxHeap):
+        def _compare(self, a, b):
+            return abs(a) < abs(b)
+
+    r = Reversed([3, 1, 4])
+    r.push(5)
+    r.extend([2, 9, 0, 7, 8])
+    assert r.pushpop(6) == 9
+    assert r.replace(-1) == 8
+    assert [r.pop() for _ in range(len(r))] == [7, 6, 5, 4, 3, 2, 1, 0, -1]
+    a = ByAbs([-5, 2, -1])
+    a.push(3)
+    assert a.peek() == -1
+    assert [a.pop() for _ in range(len(a))] == [-1, 2, 3, -5]
+
+def test_generic_sift_keeps_heap_order():
+    class Reversed(MinHeap):
+        _compare = staticmethod(operator.gt)
+
+    def is_max_heap(data):
+        return all(data[(i - 1) // 2] >= data[i] for i in range(1, len(data)))
+
+    h = Reversed([(i * 37) % 101 for i in range(60)])
+    ref = MaxHeap([(i * 37) % 101 for i in range(60)])
+    assert is_max_heap(h._data)
+    for i in range(200):
+        item = (i * 53) % 97
+        if i % 4 == 0:
+            h.push(item)
+            ref.push(item)
+        elif i % 4 == 1:
+            assert h.pop() == ref.pop()
+        elif i % 4 == 2:
+            assert h.pushpop(item) == ref.pushpop(item)
+        else:
+            assert h.replace(item) == ref.replace(item)
+        assert is_max_heap(h._data)
+    h.extend(range(100))
+    ref.extend(range(100))
+    assert is_max_heap(h._data)
+    assert [h.pop() for _ in range(len(h))] == [ref.pop() for _ in range(len(ref))]
+
+def test_weak_reference():
+    import weakref
+    for heap in (MaxHeap([1, 2]), MinHeap([1, 2])):
+        ref = weakref.ref(heap)
+        assert ref() is heap
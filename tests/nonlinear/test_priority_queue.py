@@ -169,4 +169,97 @@ def test_iteration_protocol():
     pq.push("a", priority=1)
     pq.push("b", priority=2)
     items = [x for x in pq]
-    assert set(items) == {"a", "b"}
\ No newline at end of file
+    assert set(items) == {"a", "b"}
+
+def test_bulk_build_keeps_fifo_order():
+    data = [(i % 3, i) for i in range(30)]
+    pq = PriorityQueue(data)
+    pq.extend([(0, "late")] + [(1, i) for i in range(40)])
+    out = [pq.pop() for _ in range(11)]
+    assert out == [v for p, v in data if p == 0] + ["late"]
+    pq.clear()
+    with pytest.raises(ValueError):
+        pq.extend([(1, "a"), "b"])
+    assert pq.is_empty()
+
+def test_bulk_build_with_key():
+    pq = PriorityQueue(["ccc", "a", "bb", "d"], key=len)
+    assert [pq.popitem() for _ in range(4)] == [(1, "a"), (1, "d"), (2, "bb"), (3, "ccc")]
+
+def test_remove_is_lazy_but_invisible():
+    pq = PriorityQueue([(1, "a"), (2, "b"), (3, "c"), (2, "b")])
+    pq.remove("a")
+    assert len(pq) == 3
+    assert "a" not in pq
+    assert pq.peekitem() == (2, "b")
+    pq.remove("b")
+    assert pq.count("b") == 1
+    assert sorted(pq.to_pair_list()) == [(2, "b"), (3, "c")]
+    clone = pq.copy()
+    assert pq.popitem() == (2, "b")
+    assert pq.pop() == "c"
+    assert pq.is_empty()
+    with pytest.raises(ValueError):
+        pq.remove("c")
+    with pytest.raises(IndexError):
+        pq.pop()
+    assert len(clone) == 2 and clone.pop() == "b"
+
+def test_deepcopy_shares_memo():
+    import copy
+    shared = [1]
+    pq = PriorityQueue([(2, shared), (1, shared), (3, "x")])
+    pq2 = copy.deepcopy(pq)
+    first, second = pq2.pop(), pq2.pop()
+    assert first == [1] and first is second and first is not shared
+    assert pq2.pop() == "x"
+    assert len(pq) == 3
+
+def test_extend_uniform_tuple_batches():
+    pq = PriorityQueue(key=len)
+    pq.extend([(2, "bb"), (None, "a"), (3, "ccc")])
+    assert pq.popitem() == (1, "a")
+    pq.extend([("xyzw", 0), ("x", 1)])
+    assert pq.popitem() == (2, "bb")
+    assert pq.popitem() == (2, ("xyzw", 0))
+    assert len(pq) == 2
+
+def test_ntop():
+    data = [(3, "c"), (1, "a"), (2, "b"), (1, "a2"), (5, "e")]
+    pq_min = PriorityQueue(data)
+    pq_max = PriorityQueue(data, ascending=False)
+    assert pq_min.ntop(3) == ["a", "a2", "b"]
+    assert pq_max.ntop(2) == ["e", "c"]
+    assert pq_min.ntop(0) == []
+    assert pq_min.ntop(10) == ["a", "a2", "b", "c", "e"]
+    pq_min.remove("a")
+    assert pq_min.ntop(1) == ["a2"]
+    assert len(pq_min) == 4
+
+def test_weak_reference():
+    import weakref
+    pq = PriorityQueue([(1, "a")])
+    ref = weakref.ref(pq)
+    assert ref() is pq
+
+def test_count_agrees_with_contains():
+    nan = float("nan")
+    pq = PriorityQueue([(1, nan), (2, "a"), (3, nan)])
+    assert nan in pq
+    assert pq.count(nan) == 2
+    assert pq.count(float("nan")) == 0
+    assert pq.count("a") == 1
+    pq.remove(nan)
+    assert pq.count(nan) == 1 and pq.pop() == "a"
+    with pytest.raises(ValueError):
+        pq.remove(float("nan"))
+
+def test_pickle_all_protocols():
+    import pickle
+    pq = PriorityQueue([(2, "b"), (1, "a"), (3, "c")], ascending=False)
+    pq.remove("c")
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        restored = pickle.loads(pickle.dumps(pq, protocol))
+        assert restored == pq
+        assert len(restored) == 2
+        assert restored.pop() == "b"